@@ -0,0 +1,1182 @@
+import os
+import io
+import functools
+import calendar
+import datetime
+import json
+import time
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from io import BytesIO
+import numpy as np
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PIL import Image
+from reportlab.lib import colors
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from dotenv import load_dotenv
+from pypdf import PdfWriter
+
+# Load environment variables
+load_dotenv()
+
+# Calendar names resolved once at import; pages index these instead of calling strftime
+WEEKDAYS = list(calendar.day_name)
+MONTHS = list(calendar.month_name)
+DAY_ABBREVIATIONS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+DAY_INITIALS = ["M", "T", "W", "T", "F", "S", "S"]
+
+# Shared HTTP session so every API call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# zenquotes free tier: at most this many requests per window (seconds)
+RATE_LIMIT_REQUESTS = 5
+RATE_LIMIT_WINDOW = 30
+
+# Only a few hundred distinct (text, font, size) combinations are ever measured
+string_width = functools.lru_cache(maxsize=4096)(stringWidth)
+
+@functools.lru_cache(maxsize=512)
+def wrap_lines(text, width, font, font_size):
+    """
+    Greedy word wrap measured with the real font metrics.
+    Memoized because the same quotes come round again and again over a year.
+    """
+    space = string_width(" ", font, font_size)
+    lines, line, line_w = [], [], 0
+    for word in text.split():
+        word_w = string_width(word, font, font_size)
+        if line and line_w + space + word_w > width:
+            lines.append(" ".join(line))
+            line, line_w = [word], word_w
+        else:
+            line_w += (space if line else 0) + word_w
+            line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return tuple(lines)
+
+
+def add_centred_lines(text, x, y, lines, leading):
+    """
+    Adds lines to a reportlab text object, each centred on x, the first at y.
+    Returns the y below the last line, so callers can keep going in the same BT/ET block.
+    """
+    for line in lines:
+        text.setTextOrigin(x - string_width(line, text._fontname, text._fontsize) / 2, y)
+        text.textOut(line)
+        y -= leading
+    return y
+
+
+class TrackedCanvas(canvas.Canvas):
+    """
+    Canvas that drops setFont/setFillColor/setStrokeColor calls which would not
+    change anything. It compares against the canvas's own _fontname/_fillColorObj
+    bookkeeping, which reportlab already resets on showPage, beginForm/endForm
+    and restoreState, so only text objects need syncing back.
+    """
+
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None:
+            leading = size * 1.2
+        if (psfontname, size, leading) == (self._fontname, self._fontsize, self._leading):
+            return
+        super().setFont(psfontname, size, leading)
+
+    def setFillColor(self, aColor, alpha=None):
+        if alpha is None and aColor == self._fillColorObj:
+            return
+        super().setFillColor(aColor, alpha)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        if alpha is None and aColor == self._strokeColorObj:
+            return
+        super().setStrokeColor(aColor, alpha)
+
+    def drawText(self, aTextObject):
+        super().drawText(aTextObject)
+        # Font and colour set inside BT/ET stay in effect after the text object
+        self._fontname = aTextObject._fontname
+        self._fontsize = aTextObject._fontsize
+        self._leading = aTextObject._leading
+        self._fillColorObj = aTextObject.__dict__.get("_fillColorObj", self._fillColorObj)
+        self._strokeColorObj = aTextObject.__dict__.get("_strokeColorObj", self._strokeColorObj)
+
+
+class QuoteFetcher:
+    def __init__(self, cache_file="quotes_cache.json", load=None, save=None):
+        """
+        load() and save(quotes) plug in another cache backend; by default
+        the (quote, author) pairs are kept as JSON in cache_file.
+        """
+        self.api_url = "https://zenquotes.io/api/quotes"
+        self.cache_file = cache_file
+        self._load = load or self._read_cache_file
+        self._save = save or self._write_cache_file
+        cached = self.load_cached_quotes()
+        # Unique pairs only, in order; older caches may still hold saved padding
+        self.quotes = list(dict.fromkeys(cached))
+        # Pairs already in self.quotes, so new batches are deduplicated as they arrive
+        self._seen = set(self.quotes)
+        # Only rewrite the cache when self.quotes actually changed
+        self._dirty = len(self.quotes) < len(cached)
+        # monotonic() of the last round of API calls, for the rate limit
+        self._last_round = None
+
+    def load_cached_quotes(self):
+        """Load quotes from the cache backend."""
+        # JSON stores the pairs as lists; make them hashable tuples again
+        return [tuple(x) for x in self._load()]
+
+    def save_quotes_to_cache(self):
+        """Save the current quotes to the cache backend."""
+        self._save(self.quotes)
+        self._dirty = False
+
+    def _read_cache_file(self):
+        """Default backend: the pairs stored in cache_file, if it exists."""
+        try:
+            with open(self.cache_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def _write_cache_file(self, quotes):
+        """Default backend: replace cache_file atomically."""
+        tmp_path = self.cache_file + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(quotes))
+        os.replace(tmp_path, self.cache_file)
+
+    def _fetch_batch(self):
+        """One API call; zenquotes returns about 50 random quotes per request."""
+        response = SESSION.get(self.api_url, timeout=10)
+        response.raise_for_status()
+        # item format: {'q': 'quote text', 'a': 'author name', ...}
+        return [(item.get('q'), item.get('a')) for item in response.json()]
+
+    def _fetch_round(self):
+        """
+        Sends the 5 requests one rate-limit window allows at once, first waiting
+        out the window if the previous round was too recent. Returns how many
+        new quotes arrived.
+        """
+        if self._last_round is not None:
+            time.sleep(max(0, self._last_round + RATE_LIMIT_WINDOW - time.monotonic()))
+        self._last_round = time.monotonic()
+
+        before = len(self.quotes)
+        with ThreadPoolExecutor(max_workers=RATE_LIMIT_REQUESTS) as pool:
+            jobs = [pool.submit(self._fetch_batch) for _ in range(RATE_LIMIT_REQUESTS)]
+            for job in jobs:
+                try:
+                    batch = job.result()
+                except Exception as e:
+                    print(f"Error fetching quotes: {e}")
+                    continue
+                for key in batch:
+                    if key not in self._seen:
+                        self._seen.add(key)
+                        self.quotes.append(key)
+        added = len(self.quotes) - before
+        if added:
+            self._dirty = True
+        print(f"Collected {len(self.quotes)} quotes...")
+        return added
+
+    def top_up(self, count):
+        """
+        Fetches rounds until the cache holds count unique quotes or the API has
+        nothing new. Saves after every round, so an interrupted top-up keeps its progress.
+        """
+        while len(self.quotes) < count and self._fetch_round():
+            self.save_quotes_to_cache()
+
+    def fetch_quotes(self, count=400):
+        """
+        Returns count quotes from the cache, repeating them in order if it is short.
+        We need about 366 quotes for a full year. The free tier allows 5 requests
+        per 30 seconds, so a short cache is topped up on a background thread for
+        the next run instead of holding up this one.
+        """
+        if len(self._seen) >= count:
+            print("Using cached quotes.")
+        elif not self.quotes:
+            # Nothing cached at all: one round (no rate-limit wait) beats a diary of placeholders
+            print("Fetching quotes from ZenQuotes... this may take a moment...")
+            self._fetch_round()
+
+        # Only real, unique quotes are cached, so a short run is retried next time
+        if self._dirty:
+            self.save_quotes_to_cache()
+
+        # If we have too few, repeat what we have in order
+        quotes = self.quotes or [("The secret of getting ahead is getting started.", "Mark Twain")]
+        result = [quotes[i % len(quotes)] for i in range(count)]
+
+        if len(self.quotes) < count:
+            print("Topping up the quote cache in the background for the next run...")
+            # Daemon: the diary never waits on it; each finished round is already saved
+            threading.Thread(target=self.top_up, args=(count,), daemon=True).start()
+        return result
+
+def add_bw_museum_frame(image_input):
+    """
+    Robustly handles input (Path, Bytes, or Image) 
+    and returns a B&W Framed image as JPEG bytes.
+    """
+    img = None
+
+    # 1. Normalize Input to a PIL Image
+    if isinstance(image_input, str):
+        img = Image.open(image_input)
+        
+    elif isinstance(image_input, bytes):
+        img = Image.open(io.BytesIO(image_input))
+        
+    elif hasattr(image_input, 'read'):
+        img = Image.open(image_input)
+        
+    elif isinstance(image_input, Image.Image):
+        img = image_input
+        
+    else:
+        raise ValueError(f"Unknown image input type: {type(image_input)}")
+
+    # 2. Downscale to what the page can show (16cm at 150 DPI) before any pixel work
+    target_w = int(16 * 150 / 2.54)
+    if img.width > target_w:
+        img = img.resize((target_w, int(target_w * img.height / img.width)), Image.LANCZOS)
+
+    # 3. Convert to Grayscale (B&W)
+    # Stay in "L" mode: 1 byte per pixel, and the frame is grayscale anyway
+    if img.mode == "RGB":
+        # loremflickr's grayscale photos still arrive as RGB JPEGs. If a sparse
+        # sample has identical channels, one channel already is the grayscale image.
+        sample = np.asarray(img.resize((max(1, img.width // 64), max(1, img.height // 64)), Image.NEAREST))
+        if (sample[..., 0] == sample[..., 1]).all() and (sample[..., 1] == sample[..., 2]).all():
+            img = img.getchannel(0)
+    if img.mode != "L":
+        img = img.convert("L") 
+
+    # 4. Create the Frame
+    # Paint concentric bands into one buffer instead of four ImageOps.expand copies
+    arr = np.asarray(img)
+    h, w = arr.shape
+    framed = np.empty((h + 18, w + 18), dtype=np.uint8)
+    # Outer Black Frame
+    framed[:] = 0
+    # Separator line
+    framed[3:-3, 3:-3] = 0x33
+    # Wide White Mat
+    framed[4:-4, 4:-4] = 255
+    # Inner definition line
+    framed[7:-7, 7:-7] = 0
+    framed[9:-9, 9:-9] = arr
+    img = Image.fromarray(framed, "L")
+
+    # 5. Encode once; ReportLab embeds JPEG data as-is instead of re-serializing pixels
+    buf = BytesIO()
+    # Flat grayscale borders compress well; quality 75 is visually identical here
+    img.save(buf, "JPEG", quality=75, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=16)
+def framed_month_image(raw_jpeg):
+    """
+    add_bw_museum_frame for a month's downloaded JPEG bytes, memoized on the bytes
+    so generating several diaries in one run frames each cached picture only once.
+    """
+    return add_bw_museum_frame(raw_jpeg)
+
+
+class ContentGenerator:
+    def __init__(self, image_cache_dir="image_cache"):
+        self.image_cache_dir = image_cache_dir
+        self.api_key = os.getenv("OPENROUTER_API_KEY")
+        if not self.api_key:
+            print("WARNING: OPENROUTER_API_KEY not found in .env file. AI text will be disabled.")
+        # month name -> paragraph, filled by get_all_month_inspirations
+        self._inspirations = {}
+        # month name -> JPEG bytes, filled by prefetch_all_images
+        self._image_cache = {}
+
+    def _chat(self, prompt, json_mode=False):
+        """Sends a single prompt to OpenRouter and returns the reply text."""
+        payload = {
+            "model": "mistralai/mistral-7b-instruct:free",
+            "messages": [
+                {"role": "user", "content": prompt}
+            ]
+        }
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
+        response = SESSION.post(
+            url="https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "HTTP-Referer": "https://your-site-url.com",  # Optional
+                "X-Title": "Your Site Name"  # Optional
+            },
+            data=json.dumps(payload),
+            # The batched twelve-month reply is the slowest call the diary makes
+            timeout=60
+        )
+
+        if response.status_code != 200:
+            print(f"OpenRouter Error: {response.status_code} - {response.text}")
+            return None
+        result = response.json()
+        # remove "<s>" and "</s>" if present
+        return result['choices'][0]['message']['content'].strip().replace("<s>", "").replace("</s>", "")
+
+    def get_all_month_inspirations(self, year, month_names):
+        """Generates the paragraphs for all months with one OpenRouter request."""
+        if not self.api_key:
+            return self._inspirations
+
+        prompt = (f"Return a JSON object mapping each month name to a short, poetic, and inspiring "
+                  f"paragraph (approx 60-80 words) about that month of {year}, for: "
+                  f"{', '.join(month_names)}. "
+                  f"Focus on the feeling of the season, new beginnings, or productivity. "
+                  f"Do not use hashtags.")
+
+        try:
+            content = self._chat(prompt, json_mode=True)
+            if content:
+                # Models sometimes wrap the JSON in prose or code fences
+                data = json.loads(content[content.find("{"):content.rfind("}") + 1])
+                for name in month_names:
+                    if isinstance(data.get(name), str):
+                        self._inspirations[name] = data[name].strip()
+        except Exception as e:
+            print(f"OpenRouter Exception: {e}")
+
+        return self._inspirations
+
+    def prefetch_all_inspirations(self, month_names, year):
+        """
+        Fills the inspiration cache for all months: one batched request first,
+        then concurrent single requests for any months the batch reply missed.
+        """
+        self.get_all_month_inspirations(year, month_names)
+        missing = [name for name in month_names if name not in self._inspirations]
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            for name, text in zip(missing, pool.map(lambda n: self.get_month_inspiration(n, year), missing)):
+                self._inspirations[name] = text
+        return self._inspirations
+
+    def get_month_inspiration(self, month_name, year, fetch=True):
+        """
+        Uses OpenRouter to generate an inspirational intro for the month.
+        With fetch=False only the prefetched text or the fallback is returned.
+        """
+        if month_name in self._inspirations:
+            return self._inspirations[month_name]
+        if not fetch:
+            return f"Welcome to {month_name}. A new month, a new beginning."
+        if not self.api_key:
+            return f"Welcome to {month_name}. Make it count!"
+
+        prompt = (f"Write a short, poetic, and inspiring paragraph (approx 60-80 words) "
+                  f"about the month of {month_name} {year}. "
+                  f"Focus on the feeling of the season, new beginnings, or productivity. "
+                  f"Do not use hashtags.")
+
+        try:
+            content = self._chat(prompt)
+            if content:
+                return content
+        except Exception as e:
+            print(f"OpenRouter Exception: {e}")
+
+        return f"Welcome to {month_name}. A new month, a new beginning."
+
+    def prefetch_all_images(self, month_names):
+        """Downloads the images for all months at once, at most 12 connections to loremflickr."""
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            for name, data in zip(month_names, pool.map(self._download_month_image, month_names)):
+                self._image_cache[name] = data
+        return self._image_cache
+
+    def get_month_image(self, month_name, fetch=True):
+        """
+        Returns the month's image as JPEG bytes, downloading it if it was not prefetched.
+        With fetch=False a month that was not prefetched returns None.
+        """
+        if month_name not in self._image_cache:
+            if not fetch:
+                return None
+            self._image_cache[month_name] = self._download_month_image(month_name)
+        return self._image_cache[month_name]
+
+    def _download_month_image(self, month_name):
+        """
+        Fetches a random grayscale image relevant to the month/season as JPEG bytes.
+        Uses loremflickr (free, no key required) with the /g/ (grayscale) tag.
+        Downloads are kept in image_cache_dir so later runs skip the network.
+        """
+        cache_path = os.path.join(self.image_cache_dir, f"{month_name}.jpg")
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                return f.read()
+
+        # Map months to search keywords
+        season_keywords = {
+            "January": "winter,snow,cozy", "February": "winter,love,mist",
+            "March": "spring,sprout,green", "April": "rain,flowers,bloom",
+            "May": "nature,sun,garden", "June": "summer,beach,sunshine",
+            "July": "summer,adventure,sky", "August": "summer,heat,sunset",
+            "September": "autumn,leaves,school", "October": "autumn,pumpkin,forest",
+            "November": "autumn,frost,coffee", "December": "winter,lights,celebration"
+        }
+        
+        keyword = season_keywords.get(month_name, "nature")
+        # URL structure: https://loremflickr.com/g/{width}/{height}/{keywords}/all
+        # /g/ ensures it is black and white (grayscale)
+        url = f"https://loremflickr.com/g/800/600/{keyword}/all"
+        
+        print(f"Downloading image for {month_name} ({keyword})...")
+        try:
+            response = SESSION.get(url, timeout=10)
+            if response.status_code == 200:
+                # Write to a temp file first so an interrupted run never leaves a partial image
+                os.makedirs(self.image_cache_dir, exist_ok=True)
+                tmp_path = cache_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(response.content)
+                os.replace(tmp_path, cache_path)
+
+                # Raw bytes; add_bw_museum_frame decodes them exactly once
+                return response.content
+        except Exception as e:
+            print(f"Image download error: {e}")
+
+        print(f"Using a generated placeholder image for {month_name}.")
+        month = MONTHS.index(month_name) if month_name in MONTHS else 0
+        return self._procedural_month_image(month)
+
+    def _procedural_month_image(self, month):
+        """Builds a deterministic 800x600 grayscale gradient (seeded by month) as JPEG bytes."""
+        rng = np.random.default_rng(month)
+        gradient = np.linspace(70, 210, 800)[None, :] * np.linspace(1.0, 0.6, 600)[:, None]
+        grain = rng.integers(-12, 12, size=(600, 800))
+        pixels = np.clip(gradient + grain, 0, 255).astype(np.uint8)
+
+        buf = BytesIO()
+        Image.fromarray(pixels, "L").save(buf, "JPEG")
+        return buf.getvalue()
+
+
+class DiaryGenerator:
+    """
+    Builds a year diary in one of two layouts:
+      "planner"     - vision board, linked year calendar, planner, daily and review pages
+      "quote_image" - adds an image + AI text intro per month and renders months in parallel
+    """
+    STYLES = ("planner", "quote_image")
+
+    # Daily page prompts per style: (title, number of writing lines)
+    PROMPTS = {
+        "planner": (
+            ("Today's quick wins", 3),
+            ("Health and nutrition", 3),
+            ("Today, I am grateful for...", 3),
+            ("Today's self care", 2),
+            ("Chart your cycle", 2),
+            ("Positive affirmation", 2)
+        ),
+        "quote_image": (
+            ("Today's quick wins", 3), ("Health & Nutrition", 3),
+            ("Grateful for...", 3), ("Self Care", 2),
+            ("Cycle / Mood", 2), ("Affirmation", 2)
+        ),
+    }
+
+    # End-of-month review sections per style: (title, number of writing lines)
+    REVIEW_SECTIONS = {
+        "planner": (
+            ("Biggest Achievement this month", 4),
+            ("What I learned", 4),
+            ("Things to improve next month", 4),
+            ("Memorable Moments", 4),
+            ("How did I feel overall? (Circle one)", 0) # 0 lines means custom handling
+        ),
+        "quote_image": (
+            ("Biggest Achievement", 4), ("What I Learned", 4),
+            ("To Improve", 4), ("Memorable Moments", 4)
+        ),
+    }
+
+    def __init__(self, year, filename, style="planner", test_mode=False):
+        if style not in self.STYLES:
+            raise ValueError(f"Unknown diary style: {style}")
+        self.year = year
+        self.filename = filename
+        self.style = style
+        self.test_mode = test_mode
+        self.c = TrackedCanvas(filename, pagesize=A4, pageCompression=1)
+        self.width, self.height = A4
+        self.margin = 1.5 * cm
+
+        # Colors
+        self.line_color = colors.grey
+        self.text_color = colors.black
+        self.faint_line = colors.lightgrey
+
+        # Filled by prefetch_month_assets: month -> framed JPEG bytes / inspiration text
+        self._month_images = {}
+        self._month_texts = {}
+        # Names of Form XObjects already recorded on the canvas
+        self._forms = set()
+
+        # Week grids per month, and (weekday, full date, link id) per day of the year
+        self._monthcal = {m: calendar.monthcalendar(year, m) for m in range(1, 13)}
+        self._fmt = {}
+        d = datetime.date(year, 1, 1)
+        while d.year == year:
+            self._fmt[d] = (WEEKDAYS[d.weekday()],
+                            f"{d.day:02d} {MONTHS[d.month]} {year}",
+                            f"day_{year}_{d.month:02d}_{d.day:02d}")
+            d += datetime.timedelta(days=1)
+
+        # Daily page layout, fixed for the whole diary
+        self._content_w = self.width - 2*self.margin
+        # The quote_image layout gives the schedule more room
+        self._left_w = self._content_w * (0.45 if style == "planner" else 0.55)
+        self._right_x = self.margin + self._left_w + 0.5*cm
+        self._right_edge = self.width - self.margin
+        self._dy_schedule = 0.8*cm
+        self._dy_prompt = 0.9*cm
+        self._hours = [f"{h:02d}:00" for h in range(6, 24)]
+        self._quote_w = self.width - 4*self.margin
+        self._quote_top = self.height - 1.2 * cm
+
+    def wrap_text(self, text, width, font="Helvetica", font_size=10):
+        """Wraps text to fit width points when drawn in font at font_size"""
+        return wrap_lines(text, width, font, font_size)
+
+    def stamp_form(self, name, draw):
+        """Records draw() as a named Form XObject the first time, then just references it."""
+        if name not in self._forms:
+            self.c.beginForm(name)
+            draw()
+            self.c.endForm()
+            self._forms.add(name)
+        self.c.doForm(name)
+
+    def draw_centred_string(self, x, y, text):
+        """Like canvas.drawCentredString, but with the text width taken from a cache."""
+        width = string_width(text, self.c._fontname, self.c._fontsize)
+        self.c.drawString(x - width / 2, y, text)
+
+    def draw_header(self, title, subtitle=""):
+        self.c.setFont("Helvetica-Bold", 24)
+        self.draw_centred_string(self.width / 2, self.height - 2.5 * cm, title)
+        if subtitle:
+            self.c.setFont("Helvetica", 10)
+            self.draw_centred_string(self.width / 2, self.height - 3.5 * cm, subtitle)
+
+    def prefetch_month_assets(self, months):
+        """Downloads every month's image and inspiration text concurrently."""
+        content_gen = ContentGenerator()
+        names = {m: MONTHS[m] for m in months}
+        # No context manager: its exit would wait for a stalled download and void the deadlines
+        pool = ThreadPoolExecutor(max_workers=2)
+        start = time.monotonic()
+        try:
+            # Texts and images download side by side
+            texts = pool.submit(content_gen.prefetch_all_inspirations, list(names.values()), self.year)
+            images = pool.submit(content_gen.prefetch_all_images, list(names.values()))
+            # Writing all twelve paragraphs in one reply takes the model a while
+            for job, what, limit in ((texts, "inspiration", 60), (images, "images", 20)):
+                try:
+                    job.result(timeout=max(0, start + limit - time.monotonic()))
+                except FuturesTimeoutError:
+                    print(f"Prefetch for {what} did not finish within {limit}s; using fallbacks")
+                except Exception as e:
+                    print(f"Prefetch error for {what}: {e}")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        for m, name in names.items():
+            # Anything the prefetch did not deliver falls back instead of blocking on the network
+            try:
+                raw_image = content_gen.get_month_image(name, fetch=False)
+                if raw_image is None:
+                    # Missed the deadline: still give the month its B&W placeholder
+                    raw_image = content_gen._procedural_month_image(m)
+                if raw_image:
+                    # Frame and encode each image once, ready for drawImage
+                    self._month_images[m] = framed_month_image(raw_image)
+            except Exception as e:
+                print(f"Prefetch error for {name} image: {e}")
+            self._month_texts[m] = content_gen.get_month_inspiration(name, self.year, fetch=False)
+
+    def create_annual_vision_board(self):
+        if self.style == "planner":
+            self.draw_header("Vision Board")
+
+            # Instruction text
+            text = ("Use this space to paint, doodle or cut pictures out of magazines. "
+                    "The goal is to create a powerful visualization tool to aid in manifesting "
+                    "your dreams. Bring your {} goals to life.".format(self.year))
+
+            self.c.setFont("Helvetica-Oblique", 10)
+            self.c.setFillColor(colors.darkgrey)
+
+            lines = self.wrap_text(text, self.width - 2*self.margin, "Helvetica-Oblique")
+            text = self.c.beginText()
+            add_centred_lines(text, self.width/2, self.height - 3.5*cm, lines, 14)
+            self.c.drawText(text)
+
+            self.c.setFillColor(colors.black)
+        else:
+            self.draw_header(f"{self.year} Vision Board")
+
+        self.stamp_form("vision_board", self.draw_vision_board_grid)
+
+        self.c.showPage()
+
+    def draw_vision_board_grid(self):
+        """Draws the empty boxes of the vision board, below the instructions if there are any."""
+        grid_top = self.height - (6 if self.style == "planner" else 3) * cm
+        grid_bottom = self.margin
+        grid_height = grid_top - grid_bottom
+        grid_width = self.width - 2 * self.margin
+
+        rows, cols = 4, 3
+        box_w = grid_width / cols
+        box_h = grid_height / rows
+
+        self.c.setStrokeColor(colors.grey)
+        self.c.setLineWidth(0.5)
+
+        self.c.grid([self.margin + col * box_w for col in range(cols + 1)],
+                    [grid_bottom + r * box_h for r in range(rows + 1)])
+
+    def create_year_calendar(self):
+        self.draw_header(f"{self.year} Yearly Overview")
+
+        col_w = (self.width - 2*self.margin) / 3
+        row_h = (self.height - 6*cm) / 4
+
+        start_y = self.height - 4.5 * cm
+
+        for month in range(1, 13):
+            c = (month - 1) % 3
+            r = (month - 1) // 3
+
+            x = self.margin + c * col_w
+            y = start_y - r * row_h
+
+            self.draw_mini_month(x, y, col_w, row_h, month)
+
+        self.c.showPage()
+
+    def draw_mini_month(self, x, y, width, height, month):
+        month_name = MONTHS[month]
+        self.c.setFont("Helvetica-Bold", 10)
+        self.draw_centred_string(x + width/2, y - 0.4*cm, month_name)
+
+        self.c.setFont("Helvetica", 7)
+        cell_w = width / 7
+
+        names_y = y - 0.9 * cm
+        for i, day in enumerate(DAY_INITIALS):
+            self.draw_centred_string(x + i*cell_w + cell_w/2, names_y, day)
+
+        cal = self._monthcal[month]
+        cell_h = (height - 1.2*cm) / 6
+
+        curr_y = names_y - 0.5 * cm
+        for week in cal:
+            for i, day in enumerate(week):
+                if day != 0:
+                    date_id = self._fmt[datetime.date(self.year, month, day)][2]
+
+                    self.c.setFont("Helvetica", 7)
+                    self.draw_centred_string(x + i*cell_w + cell_w/2, curr_y, str(day))
+
+                    # Link to daily page
+                    if self.has_daily_page(month, day):
+                        link_rect = (x + i*cell_w, curr_y - 2, x + (i+1)*cell_w, curr_y + 8)
+                        self.c.linkRect("", date_id, link_rect)
+            curr_y -= cell_h
+
+    def create_year_goals_page(self):
+        """Creates a structured page for yearly goals."""
+        self.draw_header(f"{self.year} Year Goals")
+
+        # Define 4 main categories
+        categories = [
+            "Personal Growth & Skills",
+            "Career & Business",
+            "Health & Wellness",
+            "Financial Freedom"
+        ]
+
+        # Layout calculations
+        start_y = self.height - 4.5 * cm
+        section_height = (start_y - self.margin) / 4
+
+        current_y = start_y
+
+        for category in categories:
+            # 1. Draw Category Title
+            # self.c.setFont("Helvetica", 9)
+            self.c.setFont("Helvetica", 15)
+            self.c.setFillColor(colors.black)
+            self.c.drawString(self.margin, current_y, category)
+
+            # 2. Draw Faint Writing Lines below the title
+            # We fit about 5 lines per section
+            line_start_y = current_y - 1.2 * cm
+            line_spacing = 0.9 * cm
+
+            self.c.setStrokeColor(HexColor("#E0E0E0")) # Very pale grey
+            self.c.setLineWidth(0.5)
+
+            category_lines = []
+            for _ in range(4): # 4 lines per category
+                category_lines.append((self.margin, line_start_y, self.width - self.margin, line_start_y))
+                line_start_y -= line_spacing
+            self.c.lines(category_lines)
+
+            # Move cursor down for next section
+            current_y -= section_height
+
+        self.c.showPage()
+
+    # --- PAGE 1: Intro Page for the Month ---
+    def create_month_intro_page(self, month):
+        month_name = MONTHS[month]
+
+        # 1. Get Content (downloaded and framed up front by prefetch_month_assets)
+        framed_jpeg = self._month_images.get(month)
+        inspiration_text = self._month_texts[month]
+
+        # 2. Draw Month Title
+        # Use 'ZapfChancery-MediumItalic' for a calligraphy look, or 'Times-Bold' for classic
+        self.c.setFont("Times-Italic", 50)
+        self.c.setFillColor(colors.black)
+
+        # Draw Title
+        title_y = self.height - 4.5 * cm
+        self.draw_centred_string(self.width / 2, title_y, month_name)
+
+        # Draw an elegant black separator line under title
+        self.c.setStrokeColor(colors.black)
+        self.c.setLineWidth(1.5)
+        self.c.line((self.width/2)-2*cm, title_y - 15, (self.width/2)+2*cm, title_y - 15)
+
+        # 3. Process and Draw Image (With Frame)
+        if framed_jpeg:
+            img_obj = ImageReader(BytesIO(framed_jpeg))
+
+            # Calculate aspect ratio to fit page nicely
+            # We want the image to be about 16cm wide maximum
+            orig_w, orig_h = img_obj.getSize()
+            aspect = orig_h / float(orig_w)
+
+            display_w = 16 * cm
+            display_h = display_w * aspect
+
+            # Center the image
+            img_x = (self.width - display_w) / 2
+
+            # Position it dynamically based on the title
+            img_y = title_y - 2*cm - display_h
+
+            self.c.drawImage(img_obj, img_x, img_y, width=display_w, height=display_h)
+        else:
+            # Fallback if no image, just set Y cursor lower
+            img_y = title_y - 5*cm
+
+        # 4. Draw Inspiration Text
+        # Use Times-Italic for a "Book Quote" feel
+        self.c.setFont("Times-Italic", 14)
+        self.c.setFillColor(colors.black) # Strictly black
+
+        # Position text relative to the bottom of the image
+        text_y = img_y - 2 * cm
+
+        # Add a decorative visual anchor (small line) before text
+        self.c.setLineWidth(0.5)
+        self.c.line((self.width/2)-1*cm, text_y + 1*cm, (self.width/2)+1*cm, text_y + 1*cm)
+
+        lines = self.wrap_text(inspiration_text, self.width - 8*cm, "Times-Italic", 14)
+        text = self.c.beginText()
+        add_centred_lines(text, self.width/2, text_y, lines, 0.8 * cm)
+        self.c.drawText(text)
+
+        self.c.showPage()
+
+    def create_monthly_planner(self, month):
+        month_name = MONTHS[month]
+        if self.style == "planner":
+            self.draw_header(f"{month_name} {self.year}")
+        else:
+            self.draw_header(f"{month_name} Overview")
+
+        # The grid only changes with the number of weeks in the month
+        cal = self._monthcal[month]
+        self.stamp_form(f"planner_{len(cal)}", lambda: self.draw_planner_grid(len(cal)))
+
+        # Day numbers
+        grid_x = self.margin
+        grid_y = self.height - 5 * cm
+        col_width = (self.width - 2 * self.margin) / 7
+        row_height = 2.5 * cm
+
+        self.c.setFont("Helvetica", 10)
+        text = self.c.beginText()
+        y = grid_y
+        for week in cal:
+            x = grid_x
+            for day in week:
+                if day != 0:
+                    text.setTextOrigin(x + 2, y - 12)
+                    text.textOut(str(day))
+                    if self.style == "planner" and self.has_daily_page(month, day):
+                        # Link to daily page
+                        date_id = self._fmt[datetime.date(self.year, month, day)][2]
+                        self.c.linkRect("", date_id, (x, y - row_height, x + col_width, y))
+                x += col_width
+            y -= row_height
+        self.c.drawText(text)
+
+        self.c.showPage()
+
+    def draw_planner_grid(self, weeks):
+        """Draws the weekday header, empty day cells and goals lines of a planner page."""
+        grid_x = self.margin
+        grid_y = self.height - 5 * cm
+        col_width = (self.width - 2 * self.margin) / 7
+        row_height = 2.5 * cm
+
+        self.c.setFillColor(colors.black)
+        self.c.setFont("Helvetica-Bold", 10)
+        text = self.c.beginText()
+        for i, day in enumerate(DAY_ABBREVIATIONS):
+            add_centred_lines(text, grid_x + (i * col_width) + (col_width/2), grid_y + 0.5*cm, [day], 0)
+        self.c.drawText(text)
+
+        self.c.setStrokeColor(colors.black)
+        self.c.grid([grid_x + i * col_width for i in range(8)],
+                    [grid_y - j * row_height for j in range(weeks + 1)])
+        y = grid_y - weeks * row_height
+
+        # Goals Section
+        if self.style == "planner":
+            note_y = y - 1 * cm
+            goals_title = "Monthly Vision & Goals:"
+        else:
+            note_y = y - 1.5 * cm
+            goals_title = "Key Goals for the Month:"
+        self.c.setFont("Helvetica-Bold", 12)
+        self.c.drawString(self.margin, note_y, goals_title)
+
+        self.c.setStrokeColor(self.faint_line)
+        goal_lines = []
+        while note_y > self.margin:
+            note_y -= 0.8 * cm
+            goal_lines.append((self.margin, note_y, self.width - self.margin, note_y))
+        self.c.lines(goal_lines)
+
+    def create_daily_page(self, date_obj, quote_data):
+        day_str, date_full, date_id = self._fmt[date_obj]
+        if self.style == "planner":
+            # Target of the planner and year calendar links
+            self.c.bookmarkPage(date_id)
+        quote, author = quote_data
+
+        # --- Top Quote Section ---
+        self.c.setFont("Helvetica-Oblique", 9)
+        self.c.setFillColor(colors.darkgrey)
+        quote_y = self._quote_top
+        wrapped = self.wrap_text(f'"{quote}"', self._quote_w, "Helvetica-Oblique", 9)
+        # Quote and author go out as a single text object
+        text = self.c.beginText()
+        quote_y = add_centred_lines(text, self.width/2, quote_y, wrapped, 10)
+        text.setFont("Helvetica-Bold", 9)
+        author_line = f"- {author}"
+        if self.style == "planner":
+            add_centred_lines(text, self.width/2, quote_y, [author_line], 10)
+            # Fixed header position, so every day shares one skeleton
+            header_y = self.height - 3 * cm
+        else:
+            # Right-aligned author, with the date header following the quote closely
+            text.setTextOrigin(self._right_edge - string_width(author_line, "Helvetica-Bold", 9), quote_y)
+            text.textOut(author_line)
+            header_y = quote_y - 1.5 * cm
+        self.c.drawText(text)
+
+        # --- Header ---
+        self.c.setFillColor(colors.black)
+        self.c.setFont("Helvetica-Bold", 18)
+        self.c.drawString(self.margin, header_y, f"{day_str} | {date_full}")
+
+        # Everything apart from the quote and date is identical for pages with
+        # the same header position, so it is drawn once per layout and reused
+        self.stamp_form(f"daily_{header_y:.0f}", lambda: self.draw_daily_skeleton(header_y))
+
+        self.c.showPage()
+
+    def draw_daily_skeleton(self, header_y):
+        """Draws the header rule, schedule, notes box and prompts of a daily page."""
+        planner = self.style == "planner"
+        self.c.setStrokeColor(colors.black)
+        self.c.setLineWidth(1)
+        rule_y = header_y - (0.5*cm if planner else 10)
+        self.c.line(self.margin, rule_y, self._right_edge, rule_y)
+
+        # Columns
+        start_y = header_y - 1.5 * cm
+        left_x2 = self.margin + self._left_w
+        right_x, right_edge = self._right_x, self._right_edge
+        dy = self._dy_schedule
+
+        # --- LEFT COLUMN: Schedule ---
+        self.c.setFillColor(colors.black)
+        self.c.setFont("Helvetica", 9)
+        curr_y = start_y
+        schedule_lines = []
+        text = self.c.beginText()
+        for hour in self._hours:
+            text.setTextOrigin(self.margin, curr_y)
+            text.textOut(hour)
+            schedule_lines.append((self.margin + 1.2*cm, curr_y-2, left_x2, curr_y-2))
+            curr_y -= dy
+        self.c.drawText(text)
+        self.c.setStrokeColor(self.faint_line)
+        self.c.lines(schedule_lines)
+
+        # Notes Box (full width at the bottom)
+        self.c.setFont("Helvetica-Bold", 10)
+        self.c.setFillColor(colors.black)
+        self.c.drawString(self.margin, curr_y - 1*cm, "Notes")
+        rect_bottom = self.margin
+        rect_height = (curr_y - 1.5*cm) - rect_bottom
+        self.c.setStrokeColor(colors.grey)
+        self.c.rect(self.margin, rect_bottom, self._content_w, rect_height)
+
+        if not planner:
+            # Add horizontal lines to the full width of the Notes rectangle
+            # Set color to a very pale grey (Lighter than standard colors.lightgrey)
+            self.c.setStrokeColor(HexColor("#E0E0E0"))
+            self.c.setLineWidth(0.5)
+
+            line_y = rect_bottom + rect_height - dy
+
+            note_lines = []
+            while line_y > rect_bottom + 0.3 * cm:
+                # Draw from left margin to right margin
+                # keep some space on the left and right for the notes
+                note_lines.append((self.margin + 0.5*cm, line_y, right_edge - 0.5*cm, line_y))
+                line_y -= dy
+            # One path for all ruled lines instead of a separate stroke per line
+            self.c.lines(note_lines)
+
+        # --- RIGHT COLUMN: Prompts ---
+        r_y = start_y + 0.5*cm
+        # Writing lines are faint; the last line of each prompt closes it off in grey
+        faint_lines, closing_lines = [], []
+        self.c.setFont("Helvetica", 9)
+        self.c.setFillColor(colors.darkgrey)
+        titles = self.c.beginText()
+        for title, count in self.PROMPTS[self.style]:
+            h = count * self._dy_prompt
+            r_y -= h
+            titles.setTextOrigin(right_x, r_y + h - 10)
+            titles.textOut(title)
+            for i in range(1, count):
+                ly = (r_y + h) - (i * dy)
+                faint_lines.append((right_x, ly, right_edge, ly))
+            # The planner closes each prompt at the bottom of its box
+            ly = r_y if planner else (r_y + h) - (count * dy)
+            closing_lines.append((right_x, ly, right_edge, ly))
+            r_y -= 0.2*cm
+        self.c.drawText(titles)
+        self.c.setStrokeColor(self.faint_line)
+        self.c.lines(faint_lines)
+        self.c.setStrokeColor(colors.grey)
+        self.c.lines(closing_lines)
+
+    def create_monthly_achievement(self, month):
+        month_name = MONTHS[month]
+        if self.style == "planner":
+            self.draw_header(f"{month_name} Review", "Celebrate your wins and reflect on your growth")
+            current_y = self.height - 4 * cm
+            title_gap = 0.8 * cm
+        else:
+            self.draw_header(f"{month_name} Review")
+            current_y = self.height - 4.5 * cm
+            title_gap = 0.6 * cm
+
+        for title, lines in self.REVIEW_SECTIONS[self.style]:
+            self.c.setFont("Helvetica-Bold", 12)
+            self.c.setFillColor(colors.black)
+            self.c.drawString(self.margin, current_y, title)
+            current_y -= title_gap
+
+            if lines > 0:
+                self.c.setStrokeColor(self.faint_line)
+                section_lines = []
+                for _ in range(lines):
+                    section_lines.append((self.margin, current_y, self.width - self.margin, current_y))
+                    current_y -= 0.9 * cm
+                self.c.lines(section_lines)
+                current_y -= 1 * cm # Spacer
+            else:
+                # Custom handling for mood/feeling
+                moods = ["Energized", "Content", "Stressed", "Productive", "Tired", "Inspired"]
+                mood_x = self.margin
+                self.c.setFont("Helvetica", 11)
+                for mood in moods:
+                    self.c.drawString(mood_x, current_y, mood)
+                    mood_x += 3 * cm
+                current_y -= 2 * cm
+
+        if self.style == "planner":
+            # Rating Box
+            self.c.setFont("Helvetica-Bold", 12)
+            self.c.drawString(self.margin, current_y, "Rate this month (1-10):")
+            self.c.rect(self.margin + 5*cm, current_y - 0.2*cm, 1.5*cm, 1.5*cm)
+
+        self.c.showPage()
+
+    def days_to_process(self, month):
+        """Days of the month that get a daily page."""
+        if self.test_mode:
+            return [1]  # Only day 1
+        return range(1, calendar.monthrange(self.year, month)[1] + 1)  # All days
+
+    def has_daily_page(self, month, day):
+        """Whether a link to this day has a daily page to land on (test mode only draws January 1)."""
+        if self.test_mode and month != 1:
+            return False
+        return day in self.days_to_process(month)
+
+    def render_month(self, month, quotes):
+        """Draws (intro,) planner, one page per day (using quotes in order) and review."""
+        month_name = MONTHS[month]
+        # 1. Month Intro (Image + AI Text)
+        if self.style == "quote_image":
+            print(f"Creating intro page for {month_name}...")
+            self.create_month_intro_page(month)
+
+        # 2. Monthly Planner
+        print(f"Creating monthly planner for {month_name}...")
+        self.create_monthly_planner(month)
+
+        # 3. Daily Pages
+        if self.test_mode:
+            print(f"Creating daily page for day 1 only...")
+        for day, q in zip(self.days_to_process(month), quotes):
+            self.create_daily_page(datetime.date(self.year, month, day), q)
+
+        # 4. End of Month Review
+        print(f"Creating end-of-month review for {month_name}...")
+        self.create_monthly_achievement(month)
+
+    def generate(self):
+        if self.test_mode:
+            print(f"*** TEST MODE ACTIVE ***")
+            print(f"Generating TEST Diary for {self.year} (January only, Day 1 only)...")
+        else:
+            print(f"Generating Diary for {self.year}...")
+
+        if self.style != "planner":
+            # The front matter stays in memory until it is merged with the months,
+            # so the output file is only ever written through the tmp file below
+            front = BytesIO()
+            self.c = TrackedCanvas(front, pagesize=A4, pageCompression=1)
+
+        # 0. Vision Board
+        self.create_annual_vision_board()
+
+        # 1. Year Calendar / Year Goals
+        if self.style == "planner":
+            self.create_year_calendar()
+        else:
+            self.create_year_goals_page()
+
+        # Quotes
+        quotes = QuoteFetcher().fetch_quotes(370)
+
+        # Determine which months to process
+        if self.test_mode:
+            months_to_process = [1]  # Only January
+            print("Processing: January only")
+        else:
+            months_to_process = range(1, 13)  # All months
+
+        # Hand each month its run of quotes (cycle if we run out)
+        month_quotes = {}
+        q_idx = 0
+        for month in months_to_process:
+            days = len(self.days_to_process(month))
+            month_quotes[month] = [quotes[(q_idx + i) % len(quotes)] for i in range(days)]
+            q_idx += days
+
+        if self.style == "planner":
+            # Planner and calendar links point at daily pages in other months,
+            # so the whole planner has to be drawn on one canvas
+            for month in months_to_process:
+                self.render_month(month, month_quotes[month])
+            self.c.save()
+        else:
+            # Fetch all images and texts in parallel before drawing
+            print("Downloading monthly images and inspiration...")
+            self.prefetch_month_assets(months_to_process)
+
+            # Render every month into its own in-memory PDF in a separate process, then merge
+            # Spawned workers: a fork could inherit a lock held by a still-running prefetch thread
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+                jobs = [pool.submit(
+                            build_month_pdf, self.year, self.style, month, month_quotes[month],
+                            self._month_images.get(month), self._month_texts[month], self.test_mode)
+                        for month in months_to_process]
+
+                self.c.save()
+                merged = PdfWriter()
+                merged.append(BytesIO(front.getvalue()))
+                for job in jobs:
+                    merged.append(BytesIO(job.result()))
+                # Each month carries its own copy of the fonts and page forms
+                merged.compress_identical_objects()
+                tmp_path = self.filename + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    merged.write(f)
+                os.replace(tmp_path, self.filename)
+
+        if self.test_mode:
+            print(f"*** TEST MODE COMPLETE ***")
+        print(f"Done! Saved as {self.filename}")
+
+
+def build_month_pdf(year, style, month, quotes, image, text, test_mode=False):
+    """
+    Renders one month into its own PDF and returns the file's bytes.
+    Runs in a worker process, so the prefetched image and text are passed in.
+    """
+    buf = BytesIO()
+    diary = DiaryGenerator(year, buf, style=style, test_mode=test_mode)
+    diary._month_images[month] = image
+    diary._month_texts[month] = text
+    diary.render_month(month, quotes)
+    diary.c.save()
+    return buf.getvalue()
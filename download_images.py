@@ -1,6 +1,11 @@
 import requests
-from PIL import Image, ImageEnhance
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PIL import Image
+import numpy as np
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import hashlib
 import os
 import random
 
@@ -8,6 +13,11 @@ import random
 output_dir = "background_images"
 os.makedirs(output_dir, exist_ok=True)
 
+# One pooled session so the download threads reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=3, backoff_factor=0.3)))
+
 # URLs for royalty-free images (replace with actual URLs or API calls)
 image_urls = [
     "https://loremflickr.com/800/600/nature",
@@ -22,29 +32,68 @@ image_urls = [
     "https://loremflickr.com/800/600/clouds"
 ]
 
+def image_path(idx, url):
+    """Output path for an image; the URL hash in the name means a changed URL gets a fresh file"""
+    key = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return os.path.join(output_dir, f"background_{idx + 1}_{key}.png")
+
+def download_image(idx, url):
+    """Fetches one image and returns its bytes, or None if the download failed"""
+    try:
+        response = SESSION.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.content
+        print(f"Failed to download image {idx + 1}: {response.status_code}")
+    except Exception as e:
+        print(f"Error downloading image {idx + 1}: {e}")
+    return None
+
+def process_image(data, output_path):
+    """Pales downloaded image bytes and saves them as a PNG; CPU-bound, so runs in a worker process"""
+    # Open image
+    img = Image.open(BytesIO(data))
+
+    # Convert to RGBA (if not already)
+    img = img.convert("RGBA")
+
+    # Make the image pale by scaling RGB to 0.3 (77/256 in fixed point), alpha untouched
+    pixels = np.asarray(img).copy()
+    pixels[..., :3] = (pixels[..., :3].astype(np.uint16) * 77 >> 8).astype(np.uint8)
+    img = Image.fromarray(pixels)
+
+    # Save the processed image; a temp file first, so an interrupted save never passes as cached
+    tmp_path = output_path + ".tmp"
+    img.save(tmp_path, "PNG")
+    os.replace(tmp_path, output_path)
+    return output_path
+
 def download_and_process_images():
+    pending = {}
     for idx, url in enumerate(image_urls):
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                # Open image
-                img = Image.open(BytesIO(response.content))
-
-                # Convert to RGBA (if not already)
-                img = img.convert("RGBA")
-
-                # Make the image pale by reducing opacity
-                enhancer = ImageEnhance.Brightness(img)
-                img = enhancer.enhance(0.3)  # Adjust brightness (0.3 = very pale)
-
-                # Save the processed image
-                output_path = os.path.join(output_dir, f"background_{idx + 1}.png")
-                img.save(output_path, "PNG")
-                print(f"Saved: {output_path}")
-            else:
-                print(f"Failed to download image {idx + 1}: {response.status_code}")
-        except Exception as e:
-            print(f"Error processing image {idx + 1}: {e}")
+        output_path = image_path(idx, url)
+        if os.path.exists(output_path):
+            print(f"Cached: {output_path}")
+        else:
+            pending[idx] = (url, output_path)
+
+    # Downloads are network-bound and go on threads; each finished download is
+    # handed straight to the process pool while the others are still in flight
+    with ThreadPoolExecutor(max_workers=10) as downloads, \
+            ProcessPoolExecutor(max_workers=os.cpu_count()) as workers:
+        fetches = {downloads.submit(download_image, idx, url): idx
+                   for idx, (url, _) in pending.items()}
+        jobs = {}
+        for fetch in as_completed(fetches):
+            idx = fetches[fetch]
+            data = fetch.result()
+            if data is not None:
+                jobs[workers.submit(process_image, data, pending[idx][1])] = idx
+
+        for job in as_completed(jobs):
+            try:
+                print(f"Saved: {job.result()}")
+            except Exception as e:
+                print(f"Error processing image {jobs[job] + 1}: {e}")
 
 if __name__ == "__main__":
     download_and_process_images()
\ No newline at end of file